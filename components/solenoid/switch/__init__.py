@@ -128,6 +128,8 @@
 #           ENABLE is held HIGH for ON, and set LOW for OFF
 
 
+import sys
+
 import esphome.codegen as cg
 import esphome.config_validation as cv
 
@@ -162,27 +164,46 @@ CONF_DC_LATCH_REDO_COUNT = "dc_latch_redo_count"
 CONF_DC_LATCH_REDO_INTERVAL_MS = "dc_latch_redo_interval_ms"
 CONF_USING_HALF_BRIDGE = "using_half_bridge"
 
+_DC_LATCHING = sys.intern("DC_LATCHING")
+
+def validate_solenoid_type(value):
+    value = cv.string(value).upper()
+    if value not in SOLENOID_TYPE_OPTIONS:
+        raise cv.Invalid(f"Unknown value '{value}', valid options are {', '.join(SOLENOID_TYPE_OPTIONS)}")
+    return sys.intern(value)
+
 # Explicitly asking for either PIN_B or USING_HALF_BRIDGE to be defined so as to avoid accidental
 # misconfiguration, plus makes the logic a teensy bit less convoluted.
 
-def validate_dc_latching_solenoid(config):
-    if config[CONF_SOLENOID_TYPE] == "DC_LATCHING":
-        if config[CONF_USING_HALF_BRIDGE] == True:
-            raise cv.Invalid("DC Latching Solenoid can't use a half-bridge as it requires a full h-bridge in order to reverse pulse polarity.")
-        if CONF_PIN_B not in config:
-            raise cv.Invalid("DC Latching Solenoid requires " + CONF_PIN_B + " to be defined.")
-    return config
+_DC_LATCHING_HALF_BRIDGE_ERROR = "DC Latching Solenoid can't use a half-bridge as it requires a full h-bridge in order to reverse pulse polarity."
+
+# Error messages indexed by (using_half_bridge << 1) | pin_b_defined.
+_DC_LATCHING_TABLE = (
+    "DC Latching Solenoid requires " + CONF_PIN_B + " to be defined.",
+    None,
+    _DC_LATCHING_HALF_BRIDGE_ERROR,
+    _DC_LATCHING_HALF_BRIDGE_ERROR,
+)
+_HB_PB_TABLE = (
+    "Must be either using a half-bridge OR have " + CONF_PIN_B + " defined. Choose only one of the two please.",
+    None,
+    None,
+    "Cannot be using a half-bridge AND have " + CONF_PIN_B + " defined. Choose one or the other please.",
+)
 
-def validate_pin_b_and_half_bridge_combo(config):
-    if CONF_USING_HALF_BRIDGE in config and config[CONF_USING_HALF_BRIDGE] == True and CONF_PIN_B in config:
-        raise cv.Invalid("Cannot be using a half-bridge AND have " + CONF_PIN_B + " defined. Choose one or the other please.")
-    if CONF_USING_HALF_BRIDGE in config and config[CONF_USING_HALF_BRIDGE] == False and CONF_PIN_B not in config:
-        raise cv.Invalid("Must be either using a half-bridge OR have " + CONF_PIN_B + " defined. Choose only one of the two please.")
+def validate_solenoid_config(config):
+    idx = (bool(config[CONF_USING_HALF_BRIDGE]) << 1) | (CONF_PIN_B in config)
+    msg = _DC_LATCHING_TABLE[idx] if config[CONF_SOLENOID_TYPE] == _DC_LATCHING else None
+    msg = msg or _HB_PB_TABLE[idx]
+    if msg:
+        raise cv.Invalid(msg)
     return config
 
 
-CONFIG_SCHEMA = cv.All(
-    switch.switch_schema(SolenoidSwitch)
+_SWITCH_SCHEMA = switch.switch_schema(SolenoidSwitch)
+
+_BASE_SCHEMA = (
+    _SWITCH_SCHEMA
     .extend(
         {
             cv.GenerateID(CONF_OUTPUT_ID): cv.declare_id(SolenoidSwitch),
@@ -194,7 +215,7 @@ CONFIG_SCHEMA = cv.All(
             cv.Optional(CONF_DC_LATCH_REDO_INTERVAL_MS, default=500): cv.int_range(min=500, max=3000),
             cv.Optional(CONF_ENERGISE_POWER_PERCENT, default = "95%"): cv.percentage,
             cv.Optional(CONF_HOLD_POWER_PERCENT, default = "55%"): cv.percentage,
-            cv.Required(CONF_SOLENOID_TYPE): cv.enum(SOLENOID_TYPE_OPTIONS, upper=True),
+            cv.Required(CONF_SOLENOID_TYPE): validate_solenoid_type,
             cv.Required(CONF_BRAKE_IS_HIGH): cv.boolean,
             cv.Optional(CONF_INVERTED, default=False): cv.boolean,
             cv.Optional(CONF_USING_HALF_BRIDGE, default = False): cv.boolean,
@@ -202,9 +223,12 @@ CONFIG_SCHEMA = cv.All(
             cv.Optional(CONF_INTERLOCK_WAIT_TIME, default="0ms"): cv.positive_time_period_milliseconds,
         }
     )
-    .extend(cv.COMPONENT_SCHEMA),
-    validate_dc_latching_solenoid,
-    validate_pin_b_and_half_bridge_combo
+    .extend(cv.COMPONENT_SCHEMA)
+)
+
+CONFIG_SCHEMA = cv.All(
+    _BASE_SCHEMA,
+    validate_solenoid_config
 )
 
 
@@ -212,15 +236,18 @@ async def to_code(config):
     solenoid_switch = await switch.new_switch(config)
     await cg.register_component(solenoid_switch, config)
 
+    # Resolve every referenced id up front, then emit the setters.
     bridge_a_side_id = await cg.get_variable(config[CONF_PIN_A])
+    bridge_b_side_id = await cg.get_variable(config[CONF_PIN_B]) if CONF_PIN_B in config else None
+    bridge_enable_pin_id = await cg.get_variable(config[CONF_BRIDGE_ENABLE_PIN]) if CONF_BRIDGE_ENABLE_PIN in config else None
+    interlock = [await cg.get_variable(it) for it in config.get(CONF_INTERLOCK, [])]
+
     cg.add(solenoid_switch.connect_a_pin(bridge_a_side_id))
 
-    if CONF_PIN_B in config:
-        bridge_b_side_id = await cg.get_variable(config[CONF_PIN_B])
+    if bridge_b_side_id is not None:
         cg.add(solenoid_switch.connect_b_pin(bridge_b_side_id))
 
-    if CONF_BRIDGE_ENABLE_PIN in config:
-        bridge_enable_pin_id = await cg.get_variable(config[CONF_BRIDGE_ENABLE_PIN])
+    if bridge_enable_pin_id is not None:
         cg.add(solenoid_switch.connect_enable_pin(bridge_enable_pin_id))
 
     cg.add(solenoid_switch.set_energise_duration_ms(config[CONF_ENERGISE_DURATION_MS]))
@@ -228,17 +255,12 @@ async def to_code(config):
     cg.add(solenoid_switch.set_dc_latch_redo_interval(config[CONF_DC_LATCH_REDO_INTERVAL_MS]))
     cg.add(solenoid_switch.set_energise_power_percent(config[CONF_ENERGISE_POWER_PERCENT]))
     cg.add(solenoid_switch.set_hold_power_percent(config[CONF_HOLD_POWER_PERCENT]))
-    cg.add(solenoid_switch.set_solenoid_type(config[CONF_SOLENOID_TYPE]))
+    cg.add(solenoid_switch.set_solenoid_type(SOLENOID_TYPE_OPTIONS[config[CONF_SOLENOID_TYPE]]))
     cg.add(solenoid_switch.set_brake(config[CONF_BRAKE_IS_HIGH]))
     cg.add(solenoid_switch.set_inverted(config[CONF_INVERTED]))
     # if CONF_USING_HALF_BRIDGE in config: - not necessary as it has a default value
     cg.add(solenoid_switch.set_half_bridge(config[CONF_USING_HALF_BRIDGE]))
 
     if CONF_INTERLOCK in config:
-        interlock = []
-        for it in config[CONF_INTERLOCK]:
-            lock = await cg.get_variable(it)
-            interlock.append(lock)
         cg.add(solenoid_switch.set_interlock(interlock))
         cg.add(solenoid_switch.set_interlock_wait_time(config[CONF_INTERLOCK_WAIT_TIME]))
-